@@ -0,0 +1,53 @@
+# core.py
+# Material data and description normalisation, shared by the Streamlit
+# entrypoint and kept import-cheap: no streamlit/pandas at module level,
+# and the derived dicts are built exactly once at import.
+from functools import lru_cache
+
+RAW_STANDARD_LENGTHS = {
+    "50X50X3SHS": 8000,
+    "100X50X3RHS": 7000,
+    "125PFC": 12000,
+    "75X50X3RHS": 8000,
+    "150PFC": 12000,
+    "150X50X5RHS": 8000,
+    "40X40X2.5SHS": 8000,
+    "40X40X3SHS": 8000,
+    "150X50X3RHS": 8000,
+    "65X35X2.5RHS": 8000,
+    "75X75X6EA": 9000,
+    "50X50X5EA": 9000,
+    "50X50X3EA": 9000,
+    "25X25X3EA": 9000,
+    "40X40X5EA": 7500,
+    "25X25X2SHS": 6500,
+    "25X25X2.5SHS": 6500,
+    "⌀6BAR": 6000,
+    "⌀12BAR": 6000,
+    "40X5FL(MS)": 6000,
+    "40X3FL(MS)": 6000,
+    "200PFC": None
+}
+
+RAW_STOCK_LIST = [
+    "100X50X3RHS",
+    "75X50X3RHS",
+    "40X40X2.5RHS",
+    "65X35X2.5RHS",
+    "40X40X5EA",
+    "⌀6BAR",
+    "⌀12BAR"
+]
+
+# --- normalise helper
+# Single translation table → one C-level pass instead of chained replaces
+_NORM_TABLE = str.maketrans({" ": "", "-": "", "/": "", "Ø": "⌀"})
+
+@lru_cache(maxsize=8192)
+def normalise(text):
+    if not isinstance(text, str):
+        return ""
+    return text.upper().translate(_NORM_TABLE)
+
+STANDARD_LENGTHS = {normalise(k): v for k, v in RAW_STANDARD_LENGTHS.items()}
+STOCK_LIST = frozenset(normalise(k) for k in RAW_STOCK_LIST)
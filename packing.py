@@ -0,0 +1,230 @@
+# packing.py
+# Best-fit-decreasing packing, kept free of any Streamlit imports so
+# worker processes can load it cheaply. numba is optional: when it isn't
+# installed, HAVE_NUMBA is False and every group takes the pure-Python
+# bisect path.
+import bisect
+
+import numpy as np
+
+NUMBA_MIN_CUTS = 500  # below this, JIT dispatch costs more than it saves
+COUNTING_SORT_MIN = 2048  # below this, Timsort wins on constant factor
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(f):
+            return f
+        return wrap
+
+
+@njit(cache=True, nogil=True)
+def bfd_kernel(cuts_desc, std_length, kerf):
+    """
+    Best-fit place cuts (sorted longest → shortest) into std_length bars.
+
+    Open bars live in two flat arrays kept sorted by remaining capacity;
+    lookup is a binary search and insert/remove are native memmoves.
+    Returns (bar_of_cut, remaining_per_bar).
+    """
+    n = cuts_desc.shape[0]
+    bar_of = np.empty(n, dtype=np.int32)
+    rem = np.empty(n, dtype=np.int32)   # remaining capacity, ascending
+    ids = np.empty(n, dtype=np.int32)   # bar id parallel to rem
+    n_open = 0
+    n_bars = 0
+
+    for k in range(n):
+        cut = cuts_desc[k]
+        need = cut + kerf
+
+        # first open bar with remaining >= need
+        lo = 0
+        hi = n_open
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if rem[mid] < need:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < n_open:
+            new_rem = rem[lo] - need
+            bar_id = ids[lo]
+            # remove slot lo
+            for i in range(lo, n_open - 1):
+                rem[i] = rem[i + 1]
+                ids[i] = ids[i + 1]
+            n_open -= 1
+        else:
+            new_rem = std_length - cut
+            bar_id = n_bars
+            n_bars += 1
+
+        bar_of[k] = bar_id
+
+        # re-insert keeping rem ascending
+        lo = 0
+        hi = n_open
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if rem[mid] < new_rem:
+                lo = mid + 1
+            else:
+                hi = mid
+        for i in range(n_open, lo, -1):
+            rem[i] = rem[i - 1]
+            ids[i] = ids[i - 1]
+        rem[lo] = new_rem
+        ids[lo] = bar_id
+        n_open += 1
+
+    bar_rem = np.zeros(n_bars, dtype=np.int32)
+    for i in range(n_open):
+        bar_rem[ids[i]] = rem[i]
+
+    return bar_of, bar_rem
+
+
+def pack_cuts(cut_lengths, std_length, kerf=0):
+    """
+    Best-Fit Decreasing for one material.
+    - Each cut goes into the tightest open bar it fits (bisect lookup)
+    - Cuts longer than half a bar pre-open their own bars
+    - Groups of NUMBA_MIN_CUTS+ cuts run through the compiled kernel
+    Returns (n_bars, offcuts, patterns).
+    """
+
+    if isinstance(cut_lengths, np.ndarray):
+        # One bulk unbox up front beats per-element boxing later
+        cut_lengths = cut_lengths.tolist()
+
+    if std_length is None:
+        # If no standard length defined, assume 1 cut per bar
+        return len(cut_lengths), [0] * len(cut_lengths), [[c] for c in cut_lengths]
+
+    # Rare materials often need just one bar — skip sort and placement
+    # entirely when the whole group fits
+    n = len(cut_lengths)
+    if n:
+        total = sum(cut_lengths) + kerf * (n - 1)
+        if total <= std_length:
+            return 1, [std_length - total], [sorted(cut_lengths, reverse=True)]
+
+    # Lengths are millimetre ints bounded by the bar, so big groups sort
+    # in O(n + L) with a histogram instead of O(n log n) comparisons
+    if len(cut_lengths) >= COUNTING_SORT_MIN:
+        counts = np.bincount(np.asarray(cut_lengths, dtype=np.int64))
+        vals = np.flatnonzero(counts)[::-1]
+        cuts = np.repeat(vals, counts[vals]).tolist()
+    else:
+        cuts = sorted(cut_lengths, reverse=True)
+
+    if cuts and cuts[0] > std_length:
+        raise ValueError(f"Cut {cuts[0]}mm longer than bar {std_length}mm")
+
+    # Big groups go through the compiled kernel; placement semantics are
+    # identical to the pure-Python path below
+    if HAVE_NUMBA and len(cuts) >= NUMBA_MIN_CUTS:
+        bar_of, bar_rem = bfd_kernel(
+            np.asarray(cuts, dtype=np.int32), std_length, kerf
+        )
+        patterns = [[] for _ in range(len(bar_rem))]
+        for cut, bar_id in zip(cuts, bar_of.tolist()):
+            patterns[bar_id].append(cut)
+        return len(patterns), bar_rem.tolist(), patterns
+
+    # Cuts longer than half a bar can never share one with an equal or
+    # larger cut, so each opens its own bar — allocate those directly and
+    # run the placement search only for the rest. Common degenerate BOMs
+    # (many identical long cuts) skip the search entirely.
+    split = 0
+    while split < len(cuts) and 2 * cuts[split] + kerf > std_length:
+        split += 1
+
+    # A bar whose remainder is below the smallest cut (plus kerf) can
+    # never take another piece — close it so the open list stays short
+    w_min = cuts[-1] + kerf if cuts else 0
+    closed = {}  # bar_id -> final remainder
+
+    # Open bars as two parallel sorted lists:
+    #   remaining[i] = mm left in that bar (ascending)
+    #   bar_ids[i]   = index into patterns for the same bar
+    patterns = [[c] for c in cuts[:split]]  # patterns[bar_id] = cuts in that bar
+    pre_rems = [std_length - c for c in cuts[:split]]  # ascending: cuts desc
+    first_open = bisect.bisect_left(pre_rems, w_min)
+    closed.update((bar_id, pre_rems[bar_id]) for bar_id in range(first_open))
+    remaining = pre_rems[first_open:]
+    bar_ids = list(range(first_open, split))
+
+    # BOMs repeat the same part heavily, so walk the sorted cuts as
+    # (length, count) runs. Under best-fit a run of equal cuts keeps
+    # landing in the same bar until it's full — the chosen bar stays the
+    # tightest fit as it shrinks — so whole batches go in per lookup.
+    idx = split
+    n_cuts = len(cuts)
+    while idx < n_cuts:
+        length = cuts[idx]
+        run_end = idx + 1
+        while run_end < n_cuts and cuts[run_end] == length:
+            run_end += 1
+        count = run_end - idx
+        idx = run_end
+
+        # Every open bar already holds a cut, so each piece costs cut + kerf
+        piece = length + kerf
+
+        # Zero/negative lengths shouldn't survive the app's filters, but
+        # never divide by them — they take no capacity, so park the run
+        # in any open bar (or one bar of their own) and move on
+        if piece <= 0:
+            if bar_ids:
+                patterns[bar_ids[-1]].extend([length] * count)
+            else:
+                patterns.append([length] * count)
+                closed[len(patterns) - 1] = std_length
+            continue
+
+        while count:
+            i = bisect.bisect_left(remaining, piece)
+
+            if i < len(remaining):
+                # Tightest bar that still fits → fill it with the run
+                rem = remaining.pop(i)
+                bar_id = bar_ids.pop(i)
+                take = min(count, rem // piece)
+                patterns[bar_id].extend([length] * take)
+                rem -= take * piece
+            else:
+                # No bar could take it → open new bar (first piece pays
+                # no kerf) and fill it too
+                bar_id = len(patterns)
+                take = min(count, 1 + (std_length - length) // piece) if piece else count
+                patterns.append([length] * take)
+                rem = std_length - length - (take - 1) * piece
+
+            count -= take
+            if rem < w_min:
+                closed[bar_id] = rem
+            else:
+                j = bisect.bisect_left(remaining, rem)
+                remaining.insert(j, rem)
+                bar_ids.insert(j, bar_id)
+
+    offcuts = [0] * len(patterns)
+    for rem, bar_id in zip(remaining, bar_ids):
+        offcuts[bar_id] = rem
+    for bar_id, rem in closed.items():
+        offcuts[bar_id] = rem
+
+    return len(patterns), offcuts, patterns
+
+
+def pack_job(job):
+    """Unpack one (cuts, std_length, kerf) tuple — executor-map friendly."""
+    cuts, std_length, kerf = job
+    return pack_cuts(cuts, std_length, kerf)
@@ -1,140 +1,81 @@
 # streamlit_app.py
 import streamlit as st
 import pandas as pd
+import numpy as np
+import csv
+import json
 import math
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO, BytesIO
 
+from core import _NORM_TABLE, STANDARD_LENGTHS, STOCK_LIST, normalise
+from packing import pack_job
+
 # === CONFIG ===
 WASTE_FACTOR = 1.005   # internal only
 KERF = 0              # set to e.g. 3 if you want saw allowance per cut
-
-RAW_STANDARD_LENGTHS = {
-    "50X50X3SHS": 8000,
-    "100X50X3RHS": 7000,
-    "125PFC": 12000,
-    "75X50X3RHS": 8000,
-    "150PFC": 12000,
-    "150X50X5RHS": 8000,
-    "40X40X2.5SHS": 8000,
-    "40X40X3SHS": 8000,
-    "150X50X3RHS": 8000,
-    "65X35X2.5RHS": 8000,
-    "75X75X6EA": 9000,
-    "50X50X5EA": 9000,
-    "50X50X3EA": 9000,
-    "25X25X3EA": 9000,
-    "40X40X5EA": 7500,
-    "25X25X2SHS": 6500,
-    "25X25X2.5SHS": 6500,
-    "⌀6BAR": 6000,
-    "⌀12BAR": 6000,
-    "40X5FL(MS)": 6000,
-    "40X3FL(MS)": 6000,
-    "200PFC": None
-}
-
-RAW_STOCK_LIST = [
-    "100X50X3RHS",
-    "75X50X3RHS",
-    "40X40X2.5RHS",
-    "65X35X2.5RHS",
-    "40X40X5EA",
-    "⌀6BAR",
-    "⌀12BAR"
-]
-
-# --- normalise helper
-def normalise(text):
-    if not isinstance(text, str):
-        return ""
-    s = text.upper()
-    s = s.replace(" ", "").replace("-", "").replace("/", "")
-    s = s.replace("\u00D8", "⌀").replace("Ø", "⌀")
-    return s
-
-STANDARD_LENGTHS = {normalise(k): v for k, v in RAW_STANDARD_LENGTHS.items()}
-STOCK_LIST = [normalise(k) for k in RAW_STOCK_LIST]
+PARALLEL_MIN_GROUPS = 5  # fewer groups than this aren't worth pool startup
+CSV_EXPORT_ROWS = 50_000  # above this, ship zipped CSVs instead of Excel
 
 # --- Streamlit init
 st.set_page_config(page_title="Steel Optimiser", layout="wide")
 for key in ["std_overrides", "paste_df", "uploaded_df"]:
     if key not in st.session_state:
         st.session_state[key] = None if "df" in key else {}
-
-# =========================================================
-# ✅ BULK SHOP-FLOOR OPTIMISER (True First-Fit Decreasing)
-# =========================================================
-def optimise_cuts(cut_lengths, std_length):
+# Materials cut from existing stock — kept apart from std_overrides so
+# that dict stays int-only and the hot path never branches on a sentinel
+if "cut_to_length" not in st.session_state:
+    st.session_state.cut_to_length = set()
+
+# --- pattern encoding for display/export
+def format_bar(bar):
+    """One bar as count×length runs, longest first: "3×1200 + 2×800"."""
+    counts = Counter(bar)
+    return " + ".join(f"{counts[l]}×{l}" for l in sorted(counts, reverse=True))
+
+def format_patterns(patterns):
     """
-    Bulk optimiser per material.
-    - True First-Fit Decreasing (FFD)
-    - Works bar-by-bar
-    - Handles kerf correctly
-    - Deterministic & shop-floor friendly
+    Run-length encoding of a list of per-bar cut lists, bars separated by
+    " | ". Bars repeat the same lengths heavily, so this is several times
+    smaller than spelling out every piece; huge pattern sets are
+    summarised so cells stay within Excel's 32767-char limit.
     """
-
-    if std_length is None:
-        # If no standard length defined, assume 1 cut per bar
-        return len(cut_lengths), [0] * len(cut_lengths), [[c] for c in cut_lengths]
-
-    # ---------------------------------------------------
-    # STEP 1: Sort cuts longest → shortest
-    # ---------------------------------------------------
-    cuts = sorted(cut_lengths, reverse=True)
-
-    # Each bar will store:
-    # {
-    #   "remaining": mm left,
-    #   "cuts": [list of cuts]
-    # }
-    bars = []
-
-    # ---------------------------------------------------
-    # STEP 2: Place each cut into first bar that fits
-    # ---------------------------------------------------
-    for cut in cuts:
-
-        if cut > std_length:
-            raise ValueError(f"Cut {cut}mm longer than bar {std_length}mm")
-
-        placed = False
-
-        for bar in bars:
-
-            # Space needed includes kerf if bar already has cuts
-            space_needed = cut
-            if len(bar["cuts"]) > 0:
-                space_needed += KERF
-
-            if bar["remaining"] >= space_needed:
-                bar["cuts"].append(cut)
-                bar["remaining"] -= space_needed
-                placed = True
-                break
-
-        # If no bar could take it → open new bar
-        if not placed:
-            bars.append({
-                "cuts": [cut],
-                "remaining": std_length - cut
-            })
-
-    # ---------------------------------------------------
-    # STEP 3: Prepare outputs
-    # ---------------------------------------------------
-    patterns = [bar["cuts"] for bar in bars]
-    offcuts = [bar["remaining"] for bar in bars]
-
-    return len(bars), offcuts, patterns
+    if len(patterns) > 500:
+        return (
+            f"{len(patterns)} bars; "
+            f"first={format_bar(patterns[0])}; last={format_bar(patterns[-1])}"
+        )
+    return " | ".join(format_bar(p) for p in patterns)
 
 # --- BOM paste parser
+# Cached on the paste text itself — reruns with an unchanged paste skip
+# the whole parse (failures aren't cached, so bad pastes retry)
+@st.cache_data(show_spinner=False)
 def try_parse_paste(paste_text):
     txt = paste_text.strip()
     if not txt:
         raise ValueError("Empty paste.")
-    for sep in ["\t", ",", ";"]:
+
+    # Sniff the separator once on a small sample so the happy path parses
+    # the paste a single time instead of once per candidate separator.
+    # If sniffing fails, count candidates in the header line instead —
+    # the commonest one is almost always right, so the retry loop below
+    # still usually succeeds on its first parse.
+    seps = ["\t", ",", ";"]
+    try:
+        sniffed = csv.Sniffer().sniff(txt[:8192], delimiters="\t,;").delimiter
+        if sniffed in seps:
+            seps.remove(sniffed)
+            seps.insert(0, sniffed)
+    except csv.Error:
+        first = txt.split("\n", 1)[0]
+        seps.sort(key=first.count, reverse=True)
+
+    for sep in seps:
         try:
-            df = pd.read_csv(StringIO(txt), sep=sep)
+            df = pd.read_csv(StringIO(txt), sep=sep, engine="c")
             cols = {c.strip().lower() for c in df.columns}
             if {"description", "length", "qty"} <= cols:
                 return df
@@ -142,6 +83,102 @@ def try_parse_paste(paste_text):
             continue
     raise ValueError("Could not parse pasted BOM.")
 
+# --- cached upload reader
+# Keyed on (name, bytes) so widget interactions elsewhere don't re-parse
+# the same file on every rerun
+@st.cache_data(show_spinner=False)
+def read_upload(name, data):
+    bio = BytesIO(data)
+    if name.lower().endswith(".csv"):
+        # pyarrow parses multi-threaded; messy Excel-exported CSVs can
+        # trip it up, so fall back to the default engine on any failure
+        try:
+            return pd.read_csv(bio, engine="pyarrow")
+        except Exception:
+            bio.seek(0)
+            return pd.read_csv(bio)
+    # calamine (Rust) reads XLSX far faster than openpyxl; fall back to
+    # pandas' default engine where python-calamine isn't installed
+    try:
+        return pd.read_excel(bio, engine="calamine")
+    except ImportError:
+        bio.seek(0)
+        return pd.read_excel(bio)
+
+# --- Excel serialisation
+# xlsxwriter builds cells natively instead of through openpyxl's Python
+# object tree. Its constant_memory mode is NOT safe here: it flushes each
+# row as soon as a later one is written, but to_excel emits cells
+# column-by-column, which silently drops every column after the first.
+def build_xlsx(buy_df, check_df):
+    out = BytesIO()
+    with pd.ExcelWriter(
+        out,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"strings_to_urls": False}},
+    ) as writer:
+        buy_df.to_excel(writer, sheet_name="BUY", index=False)
+        if not check_df.empty:
+            check_df.to_excel(writer, sheet_name="CHECK", index=False)
+    return out.getvalue()
+
+# --- CSV fast path for very large outputs
+# to_csv streams rows with none of the per-cell workbook cost, so huge
+# results export in a fraction of the Excel time
+def build_csv_zip(buy_df, check_df):
+    out = BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("BUY.csv", buy_df.to_csv(index=False))
+        if not check_df.empty:
+            zf.writestr("CHECK.csv", check_df.to_csv(index=False))
+    return out.getvalue()
+
+# --- cached column normalisation
+# Keyed on the column's contents, so reruns that don't touch the BOM skip
+# re-normalising every row
+@st.cache_data(show_spinner=False)
+def norm_column(s):
+    # Vectorised .str pipeline — no per-row Python dispatch. Non-string
+    # cells come out of .str as NaN and normalise to "" like the scalar
+    # helper does. A fully numeric column (e.g. part codes) has no .str
+    # accessor at all, so degrade to the memoized scalar like the old
+    # apply did — cheap, since such columns have few unique values.
+    try:
+        return s.str.upper().str.translate(_NORM_TABLE).fillna("")
+    except AttributeError:
+        return s.map(normalise)
+
+# --- cached prepare pipeline
+# Keyed on the source frame's contents and the multiplier, so reruns
+# triggered by unrelated widgets skip the whole rename/coerce/normalise
+# pass instead of redoing it row by row
+@st.cache_data(show_spinner=False)
+def prepare_work_df(src, multiplier):
+    cols = {c.lower(): c for c in src.columns}
+    df = src.rename(columns={
+        cols["description"]: "Description",
+        cols["length"]: "Length",
+        cols["qty"]: "Qty"
+    })
+
+    # int32/float32 halve memory traffic over the defaults and match the
+    # int32 arrays the packing kernel wants; bar lengths are mm in the
+    # thousands, nowhere near either limit
+    # One buffer instead of the fillna/astype/mul chain of intermediates
+    qty = pd.to_numeric(df["Qty"], errors="coerce").to_numpy(
+        dtype=np.float64, na_value=0.0
+    )
+    df["Qty"] = (qty * multiplier).astype(np.int32)
+    df["Length"] = pd.to_numeric(df["Length"], errors="coerce").astype("float32")
+    # Categorical key: the groupby dispatches on integer codes instead of
+    # hashing strings, and repeated descriptions stop duplicating storage
+    df["desc_norm"] = norm_column(df["Description"]).astype("category")
+    df["Parent"] = df.get("Parent", pd.Series("", index=df.index)).astype("category")
+
+    # Drop unusable rows once here so the per-group hot path never re-masks
+    # (NaN compares False, so the > 0 check covers missing lengths too)
+    return df[(df["Length"] > 0) & (df["Qty"] > 0)]
+
 # === UI ===
 st.title("🔩 Steel Optimiser")
 
@@ -152,6 +189,16 @@ multiplier = st.number_input(
     step=1
 )
 
+# Registered once here — widgets inside the processing loop would be
+# re-registered per group and collide on rerun
+default_stock_length = st.sidebar.number_input(
+    "Fallback stock length (mm)",
+    min_value=0,
+    value=0,
+    step=500,
+    help="Used for materials with no standard length. 0 = one bar per cut.",
+)
+
 tab1, tab2 = st.tabs(["Paste BOM", "Upload file"])
 
 with tab1:
@@ -164,7 +211,7 @@ with tab1:
 with tab2:
     uploaded_file = st.file_uploader("Upload CSV/XLSX", type=["csv", "xls", "xlsx"])
     if uploaded_file:
-        df_up = pd.read_csv(uploaded_file) if uploaded_file.name.endswith(".csv") else pd.read_excel(uploaded_file)
+        df_up = read_upload(uploaded_file.name, uploaded_file.getvalue())
         df_up = st.data_editor(df_up, num_rows="dynamic")
         st.session_state.uploaded_df = df_up
 
@@ -177,60 +224,256 @@ df_source = (
 if df_source is None:
     st.stop()
 
-cols = {c.lower(): c for c in df_source.columns}
-df = df_source.rename(columns={
-    cols["description"]: "Description",
-    cols["length"]: "Length",
-    cols["qty"]: "Qty"
-})
+df = prepare_work_df(df_source, multiplier)
 
-df["Qty"] = pd.to_numeric(df["Qty"], errors="coerce").fillna(0).astype(int) * multiplier
-df["Length"] = pd.to_numeric(df["Length"], errors="coerce")
-df["desc_norm"] = df["Description"].apply(normalise)
-df["Parent"] = df.get("Parent", "")
+# Coercion never raises (errors="coerce"), so bad rows vanish in the
+# filter — say how many were dropped rather than failing silently
+dropped = len(df_source) - len(df)
+if dropped:
+    st.warning(f"Ignoring {dropped} row(s) with non-numeric Length or zero/invalid Qty.")
 
 # --- Length overrides
+# One data_editor instead of a text_input per material: a single widget
+# diff per rerun regardless of how many materials the BOM has
 st.header("Material length confirmation")
-for d in df["desc_norm"].unique():
-    name = df.loc[df["desc_norm"] == d, "Description"].iloc[0]
-    default = STANDARD_LENGTHS.get(d)
-    val = st.text_input(name, value=str(default) if default else "")
-    if val.strip():
-        st.session_state.std_overrides[d] = int(val)
+st.caption("Stock length in mm, or CUT to cut from existing stock instead of buying bars.")
+
+unique_desc = df["desc_norm"].unique().tolist()
+# First readable description per material, built in one pass — the old
+# df.loc mask per material rescanned the whole frame M times
+first_desc = df.drop_duplicates("desc_norm").set_index("desc_norm")["Description"].to_dict()
+def _default_len(d):
+    if d in st.session_state.cut_to_length:
+        return "CUT"
+    if d in st.session_state.std_overrides:
+        return str(st.session_state.std_overrides[d])
+    # Materials we keep as floor stock default to CUT — check against
+    # what's on hand instead of buying bars. Still editable to a length.
+    if d in STOCK_LIST:
+        return "CUT"
+    prior = STANDARD_LENGTHS.get(d)
+    return str(prior) if prior else ""
+
+override_df = pd.DataFrame({
+    "Description": [first_desc[d] for d in unique_desc],
+    "Key": unique_desc,
+    "Length (mm or CUT)": [_default_len(d) for d in unique_desc],
+})
+edited = st.data_editor(
+    override_df,
+    key="overrides_editor",
+    num_rows="fixed",
+    hide_index=True,
+    column_config={
+        "Description": st.column_config.Column(disabled=True),
+        "Key": None,
+    },
+)
+
+overrides = {}
+cut_set = set()
+for key, val in zip(edited["Key"], edited["Length (mm or CUT)"]):
+    v = str(val).strip()
+    if not v or v.lower() == "nan":
+        continue
+    if v.upper() == "CUT":
+        cut_set.add(key)
+    else:
+        try:
+            overrides[key] = int(float(v))
+        except ValueError:
+            continue
+st.session_state.std_overrides = overrides
+st.session_state.cut_to_length = cut_set
 
 # --- Process
 if st.button("Process BOM"):
     buy_rows = []
+    check_rows = []
+    # The patterns table has a row per bar, so keep it as parallel column
+    # lists — DataFrame construction then skips per-row dict hashing
+    pat_desc, pat_bar, pat_pieces, pat_used, pat_off = [], [], [], [], []
+
+    # Resolve every material's bar length once up front; the group loop
+    # then avoids session_state and dict-chain lookups per group
+    overrides = st.session_state.std_overrides
+    cut_set = st.session_state.cut_to_length
+    resolved_len = {
+        d: overrides.get(d, STANDARD_LENGTHS.get(d)) or (default_stock_length or None)
+        for d in df["desc_norm"].unique()
+    }
+
+    # CUT materials never reach the packer, so don't expand their cuts at
+    # all — the CHECK totals reduce over ceil(length)·qty directly
+    cut_mask = df["desc_norm"].isin(cut_set)
+    if cut_mask.any():
+        cut_part = df.loc[cut_mask, ["desc_norm", "Length", "Qty"]]
+        eff_total = np.ceil(
+            cut_part["Length"].to_numpy(dtype=np.float64) * WASTE_FACTOR
+        ).astype(np.int64) * cut_part["Qty"].to_numpy(dtype=np.int64)
+        agg = (
+            cut_part.assign(eff=eff_total)
+            .groupby("desc_norm", sort=False, observed=True)[["Qty", "eff"]]
+            .sum()
+        )
+        for d, n_cuts, total_len in zip(agg.index, agg["Qty"], agg["eff"]):
+            check_rows.append({
+                "Description": first_desc[d],
+                "Total Cuts": int(n_cuts),
+                "Total Length (mm)": int(total_len),
+            })
 
-    for desc, g in df.groupby("desc_norm"):
-        std_len = st.session_state.std_overrides.get(desc, STANDARD_LENGTHS.get(desc))
-        cuts_nom = []
-        cuts_eff = []
-
-        for _, r in g.iterrows():
-            cuts_nom.extend([math.ceil(r["Length"])] * r["Qty"])
-            cuts_eff.extend([math.ceil(r["Length"] * WASTE_FACTOR)] * r["Qty"])
-
-        bars, offcuts, patterns_eff = optimise_cuts(cuts_eff, std_len)
-        total_used = sum(sum(bar) for bar in patterns_eff)
-        total_available = bars * std_len
-        efficiency = round((total_used / total_available) * 100, 1) if bars > 0 else 0
+    # Expand every remaining cut for the whole BOM in one vectorised pass,
+    # then split on material boundaries — no per-group sub-frame slicing
+    # at all. Sorting by the categorical key clusters each material's rows.
+    df_s = df[~cut_mask].sort_values("desc_norm", kind="stable")
+    lengths = df_s["Length"].to_numpy(dtype=np.float64)
+    qtys = df_s["Qty"].to_numpy(dtype=np.int64)
+    all_eff = np.repeat(np.ceil(lengths * WASTE_FACTOR).astype(np.int64), qtys)
+    all_codes = np.repeat(df_s["desc_norm"].cat.codes.to_numpy(), qtys)
+    cats = df_s["desc_norm"].cat.categories
+
+    # Per-code lookup tables so the group loop indexes by categorical code
+    # instead of hashing description strings through dicts and sets
+    std_len_by_code = [resolved_len.get(c) for c in cats]
+    name_by_code = [first_desc.get(c) for c in cats]
+
+    jobs = []
+    meta = []
+    if all_codes.size:
+        boundaries = np.flatnonzero(all_codes[1:] != all_codes[:-1]) + 1
+        group_codes = all_codes[np.r_[0, boundaries]]
+        groups_eff = np.split(all_eff, boundaries)
+    else:
+        group_codes = []
+        groups_eff = []
+
+    for code, cuts_eff in zip(group_codes, groups_eff):
+        jobs.append((cuts_eff, std_len_by_code[code], KERF))
+        meta.append((name_by_code[code], std_len_by_code[code]))
+
+    # Re-clicks while tuning overrides repeat most materials unchanged, so
+    # memoize packing per (cuts, bar length) — only edited groups re-pack
+    memo = st.session_state.setdefault("pack_memo", {})
+    if len(memo) > 256:
+        memo.clear()
+    keys = [(cuts.tobytes(), std_len) for cuts, std_len, _ in jobs]
+    todo_keys = []
+    todo_jobs = []
+    seen = set()
+    for key, job in zip(keys, jobs):
+        if key not in memo and key not in seen:
+            seen.add(key)
+            todo_keys.append(key)
+            todo_jobs.append(job)
+
+    if len(todo_jobs) >= PARALLEL_MIN_GROUPS:
+        # Threads, not processes: the numba kernel runs nogil, so big
+        # groups overlap on real cores with no fork or pickling cost
+        with ThreadPoolExecutor() as ex:
+            memo.update(zip(todo_keys, ex.map(pack_job, todo_jobs)))
+    else:
+        memo.update(zip(todo_keys, map(pack_job, todo_jobs)))
+
+    results = [memo[key] for key in keys]
+
+    for (readable, std_len), (bars, offcuts, patterns_eff) in zip(meta, results):
+        # The packer already tracked what's left per bar, so totals come
+        # from the offcuts — no second pass over every cut
+        total_waste = sum(offcuts)
+        total_available = bars * std_len if std_len else 0
+        total_used = total_available - total_waste
+        efficiency = round((total_used / total_available) * 100, 1) if total_available > 0 else 0
        
         patterns_nom = [
             [math.ceil(c / WASTE_FACTOR) for c in bar]
             for bar in patterns_eff
         ]
 
+        for i, (p, off) in enumerate(zip(patterns_nom, offcuts), start=1):
+            pat_desc.append(readable)
+            pat_bar.append(i)
+            pat_pieces.append(json.dumps(p, separators=(",", ":")))
+            pat_used.append(sum(p))
+            pat_off.append(off)
+
         buy_rows.append({
-            "Description": g["Description"].iloc[0],
+            "Description": readable,
             "Standard Bar Length": std_len,
             "Bars Required": bars,
             "Efficiency %": efficiency,
-            "Total Waste (mm)": sum(offcuts),
-            "Avg Offcut": round(sum(offcuts) / len(offcuts), 1),
-            "Cutting Patterns": patterns_nom
+            "Total Waste (mm)": total_waste,
+            "Avg Offcut": round(total_waste / bars, 1) if bars else 0,
+            "Cutting Patterns": format_patterns(patterns_nom)
         })
 
+    # Explicit dtypes: Arrow serialisation to the frontend and the Excel
+    # writer both skip per-cell object inference when columns are typed
     out_df = pd.DataFrame(buy_rows)
-    st.dataframe(out_df, use_container_width=True)
+    if len(out_df):
+        out_df = out_df.astype({
+            "Description": "string",
+            "Standard Bar Length": "Int32",  # nullable — CUT-less fallback is None
+            "Bars Required": "int32",
+            "Efficiency %": "float32",
+            "Total Waste (mm)": "int64",
+            "Avg Offcut": "float32",
+            "Cutting Patterns": "string",
+        })
+    check_df = pd.DataFrame(check_rows)
+    if len(check_df):
+        check_df = check_df.astype({
+            "Description": "string",
+            "Total Cuts": "int32",
+            "Total Length (mm)": "int64",
+        })
+
+    # Kick off serialisation now; it overlaps with the dataframe
+    # rendering below and .result() only blocks for whatever is left.
+    # Past CSV_EXPORT_ROWS the per-cell Excel cost stops being worth it.
+    big_export = len(out_df) + len(check_df) > CSV_EXPORT_ROWS
+    export_future = ThreadPoolExecutor(max_workers=1).submit(
+        build_csv_zip if big_export else build_xlsx, out_df, check_df
+    )
+
+    # Export keeps the full pattern strings; on screen a trimmed cell is
+    # enough to eyeball, and Arrow stops shipping huge cells per rerun
+    display_df = out_df.copy()
+    if len(display_df):
+        pat = display_df["Cutting Patterns"]
+        display_df["Cutting Patterns"] = pat.where(
+            pat.str.len() <= 200, pat.str.slice(0, 200) + "…"
+        )
+    st.dataframe(display_df, use_container_width=True)
+
+    if not check_df.empty:
+        st.subheader("Cut from stock (CHECK)")
+        st.dataframe(check_df, use_container_width=True)
+
+    # One virtualised dataframe for bar-by-bar detail — a widget per bar
+    # would dominate render time on big BOMs
+    with st.expander("Bar-by-bar cutting patterns"):
+        patterns_df = pd.DataFrame({
+            "Description": pat_desc,
+            "Bar": pat_bar,
+            "Pieces": pat_pieces,
+            "Used (mm)": pat_used,
+            "Offcut (mm)": pat_off,
+        })
+        st.dataframe(patterns_df, use_container_width=True, hide_index=True)
+
+    if big_export:
+        st.download_button(
+            "⬇️ Download CSV output (zipped)",
+            data=export_future.result(),
+            file_name="optimised_cutting_list.zip",
+            mime="application/zip",
+        )
+    else:
+        st.download_button(
+            "⬇️ Download Excel output",
+            data=export_future.result(),
+            file_name="optimised_cutting_list.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
     st.success("Optimisation complete.")